@@ -1,6 +1,14 @@
 import tkinter as tk
-from tkinter import messagebox
-from password_validator import is_valid_password
+from tkinter import ttk
+from password_validator import (
+    is_valid_password,
+    COMMON_PASSWORDS,
+    _UPPER,
+    _LOWER,
+    _DIGIT,
+    _SYMBOL,
+    _SPACE,
+)
 
 class PasswordValidatorGUI:
     def __init__(self, root):
@@ -22,7 +30,7 @@ class PasswordValidatorGUI:
         entry_frame.pack(pady=(0, 10))
         entry_border = tk.Frame(entry_frame, bg="#bdbdbd", highlightbackground="#bdbdbd", highlightthickness=1)
         entry_border.pack(side="left", padx=(0, 8))
-        self.pwd_entry = tk.Entry(entry_border, show="*", width=28, font=("Arial", 14), relief="flat", bd=0, bg="#fff")
+        self.pwd_entry = ttk.Entry(entry_border, show="*", width=28, font=("Arial", 14))
         self.pwd_entry.pack(ipady=6)
 
         # Show/hide password checkbox
@@ -36,19 +44,24 @@ class PasswordValidatorGUI:
         tooltip_icon.bind("<Enter>", lambda e: self.show_tooltip())
         tooltip_icon.bind("<Leave>", lambda e: self.hide_tooltip())
 
-        # Tooltip label
-        self.tooltip = tk.Label(main_frame, text="Password must meet all requirements below.", font=("Arial", 10), bg="#fffde7", fg="#333", bd=1, relief="solid")
-        self.tooltip.place_forget()
+        # Tooltip label is not visible at startup, so defer building it
+        # until Tk is idle — the main window paints sooner.
+        self.main_frame = main_frame
+        self.tooltip = None
+        self.root.after_idle(self._build_tooltip)
 
-        # Requirements checklist
+        # Requirements checklist.
+        # Each check delegates to the frozensets shared with the validator
+        # module; frozenset.isdisjoint scans the string in a single C loop,
+        # so every check is one C-level set operation.
         self.requirements = [
             ("At least 8 characters", lambda pwd: len(pwd) >= 8),
-            ("Contains uppercase letter", lambda pwd: any(c.isupper() for c in pwd)),
-            ("Contains lowercase letter", lambda pwd: any(c.islower() for c in pwd)),
-            ("Contains digit", lambda pwd: any(c.isdigit() for c in pwd)),
-            ("Contains special character (!@#$%^&* etc.)", lambda pwd: any(c in '!@#$%^&*(),.?":{}|<>' for c in pwd)),
-            ("No whitespace", lambda pwd: not any(c.isspace() for c in pwd)),
-            ("Not a common password", lambda pwd: pwd not in {"password", "123456", "qwerty", "letmein", "admin", "iloveyou"}),
+            ("Contains uppercase letter", lambda pwd: not _UPPER.isdisjoint(pwd)),
+            ("Contains lowercase letter", lambda pwd: not _LOWER.isdisjoint(pwd)),
+            ("Contains digit", lambda pwd: not _DIGIT.isdisjoint(pwd)),
+            ("Contains special character (!@#$%^&* etc.)", lambda pwd: not _SYMBOL.isdisjoint(pwd)),
+            ("No whitespace", lambda pwd: _SPACE.isdisjoint(pwd)),
+            ("Not a common password", lambda pwd: pwd.lower() not in COMMON_PASSWORDS),
         ]
         self.req_labels = []
         req_frame = tk.Frame(main_frame, bg="#f5f5f5")
@@ -58,11 +71,16 @@ class PasswordValidatorGUI:
             lbl.pack(fill="x", padx=8, pady=1)
             self.req_labels.append(lbl)
 
-        # Strength meter
+        # Strength meter.
+        # A ttk.Progressbar updates via a single configure call instead of
+        # the Canvas delete/create cycle, so per-keystroke redraws are cheap.
         self.strength_var = tk.StringVar(value="")
         strength_frame = tk.Frame(main_frame, bg="#f5f5f5")
         strength_frame.pack(pady=(6, 0))
-        self.strength_bar = tk.Canvas(strength_frame, width=260, height=18, bg="#e0e0e0", highlightthickness=0)
+        style = ttk.Style()
+        for tier, color in (("Weak", "#d32f2f"), ("Medium", "#fbc02d"), ("Strong", "#388e3c")):
+            style.configure(f"{tier}.Horizontal.TProgressbar", background=color, troughcolor="#e0e0e0")
+        self.strength_bar = ttk.Progressbar(strength_frame, length=260, maximum=len(self.requirements), mode="determinate")
         self.strength_bar.pack(side="top", anchor="center")
         self.strength_label = tk.Label(strength_frame, textvariable=self.strength_var, font=("Arial", 10, "bold"), bg="#f5f5f5")
         self.strength_label.pack(side="top", pady=(0, 8), anchor="center")
@@ -86,26 +104,56 @@ class PasswordValidatorGUI:
         btn_frame.grid_columnconfigure(1, weight=1)
         btn_frame.grid_columnconfigure(2, weight=1)
 
+        # Pending debounce callback id for real-time validation
+        self._pending = None
+
+        # Last drawn strength score and per-label states, used to skip
+        # Tk redraws/reconfigs when nothing visible has changed.
+        self._last_score = -1
+        self._last_req_state = [None] * len(self.requirements)
+
         # Bind real-time feedback
         self.pwd_entry.bind("<KeyRelease>", self.on_password_change)
 
     # --- Class methods ---
     def on_password_change(self, event=None):
+        # Debounce: coalesce rapid keystrokes into one validation pass,
+        # so fast typing doesn't trigger a full check + redraw per key.
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+        self._pending = self.root.after(80, self._do_validate)
+
+    def _do_validate(self):
+        self._pending = None
         pwd = self.pwd_entry.get()
-        for i, (text, check) in enumerate(self.requirements):
-            if check(pwd):
+        # Run each check exactly once and reuse the results for both the
+        # checklist coloring and the strength score.
+        results = [check(pwd) for _, check in self.requirements]
+        for i, ok in enumerate(results):
+            # Only touch the Tk label when its state actually flipped
+            if ok == self._last_req_state[i]:
+                continue
+            self._last_req_state[i] = ok
+            text = self.requirements[i][0]
+            if ok:
                 self.req_labels[i].config(text=f"✓ {text}", fg="#388e3c")
             else:
                 self.req_labels[i].config(text=f"✗ {text}", fg="#d32f2f")
-        score = sum(check(pwd) for _, check in self.requirements)
+        score = sum(results)
+        if score == self._last_score:
+            # Same strength tier as last keystroke: the bar and label are
+            # already correct, so skip the Canvas teardown/rebuild entirely.
+            self.result_label.config(text="")
+            return
+        self._last_score = score
         if score <= 3:
-            color, label = "#d32f2f", "Weak"
+            label = "Weak"
         elif score <= 5:
-            color, label = "#fbc02d", "Medium"
+            label = "Medium"
         else:
-            color, label = "#388e3c", "Strong"
-        self.strength_bar.delete("all")
-        self.strength_bar.create_rectangle(0, 0, score*37, 18, fill=color, outline="")
+            label = "Strong"
+        self.strength_bar["value"] = score
+        self.strength_bar.configure(style=f"{label}.Horizontal.TProgressbar")
         self.strength_var.set(f"Password strength: {label}")
         self.result_label.config(text="")
 
@@ -120,12 +168,17 @@ class PasswordValidatorGUI:
         self.result_label.config(text="", fg="black")
         for i, (text, _) in enumerate(self.requirements):
             self.req_labels[i].config(text=f"✗ {text}", fg="#d32f2f")
-        self.strength_bar.delete("all")
+        self.strength_bar["value"] = 0
         self.strength_var.set("")
+        self._last_score = -1
+        self._last_req_state = [None] * len(self.requirements)
 
     def validate_password(self):
         password = self.pwd_entry.get()
         if not password:
+            # Imported lazily: only this error path ever needs messagebox,
+            # so the module doesn't have to load at startup.
+            from tkinter import messagebox
             messagebox.showwarning("Input Error", "Please enter a password.")
             return
         if is_valid_password(password):
@@ -133,11 +186,18 @@ class PasswordValidatorGUI:
         else:
             self.result_label.config(text=f"Rejected ❌\n{password}", fg="#d32f2f")
 
+    def _build_tooltip(self):
+        self.tooltip = tk.Label(self.main_frame, text="Password must meet all requirements below.", font=("Arial", 10), bg="#fffde7", fg="#333", bd=1, relief="solid")
+        self.tooltip.place_forget()
+
     def show_tooltip(self):
+        if self.tooltip is None:
+            self._build_tooltip()
         self.tooltip.place(x=50, y=100)
 
     def hide_tooltip(self):
-        self.tooltip.place_forget()
+        if self.tooltip is not None:
+            self.tooltip.place_forget()
 
 
 def main():